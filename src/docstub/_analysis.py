@@ -443,6 +443,9 @@ class TypesDatabase:
             "unknown_doctypes": [],
         }
 
+        # Results of `query`
+        self._query_cache = {}
+
     def query(self, search_name):
         """Search for a known annotation name.
 
@@ -457,6 +460,34 @@ class TypesDatabase:
         known_import : KnownImport | None
             If it was found, import information matching the `annotation_name`.
         """
+        # The same names are searched a lot. Whether they match may depend on
+        # the current module, so results are cached per module
+        cache_key = (search_name, self.current_source)
+        try:
+            annotation_name, known_import = self._query_cache[cache_key]
+        except KeyError:
+            annotation_name, known_import = self._search(search_name)
+            self._query_cache[cache_key] = annotation_name, known_import
+
+        if annotation_name is not None:
+            self.stats["successful_queries"] += 1
+        else:
+            self.stats["unknown_doctypes"].append(search_name.removeprefix("~."))
+
+        return annotation_name, known_import
+
+    def _search(self, search_name):
+        """Search for a known annotation name without caching.
+
+        Parameters
+        ----------
+        search_name : str
+
+        Returns
+        -------
+        annotation_name : str | None
+        known_import : KnownImport | None
+        """
         annotation_name = None
         known_import = None
 
@@ -517,11 +548,6 @@ class TypesDatabase:
                 annotation_name.find(known_import.target) :
             ]
 
-        if annotation_name is not None:
-            self.stats["successful_queries"] += 1
-        else:
-            self.stats["unknown_doctypes"].append(search_name)
-
         return annotation_name, known_import
 
     def __repr__(self):
@@ -1,6 +1,7 @@
 import logging
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import contextmanager
 from pathlib import Path
 
@@ -98,6 +99,88 @@ def _build_import_map(config, source_dir):
     return known_imports
 
 
+def _generate_stub(source_path, stub_path, *, stub_transformer):
+    """Create and write the stub file for a single source file.
+
+    Parameters
+    ----------
+    source_path : Path
+    stub_path : Path
+    stub_transformer : ~.Py2StubTransformer
+    """
+    if source_path.suffix.lower() == ".pyi":
+        logger.debug("using existing stub file %s", source_path)
+        with source_path.open() as fo:
+            stub_content = fo.read()
+    else:
+        with source_path.open() as fo:
+            py_content = fo.read()
+        logger.debug("creating stub from %s", source_path)
+        try:
+            stub_content = stub_transformer.python_to_stub(
+                py_content, module_path=source_path
+            )
+        except (SystemExit, KeyboardInterrupt):
+            raise
+        except Exception as e:
+            logger.exception("failed creating stub for %s:\n\n%s", source_path, e)
+            return
+    stub_path.parent.mkdir(parents=True, exist_ok=True)
+    with stub_path.open("w") as fo:
+        logger.info("wrote %s", stub_path)
+        fo.write(stub_content)
+
+
+# State of the current worker process, see `_init_worker`
+_worker_state = {}
+
+
+def _init_worker(types_db, replace_doctypes, verbose):
+    """Prepare a worker process to generate stubs.
+
+    Parameters
+    ----------
+    types_db : ~.TypesDatabase
+    replace_doctypes : dict[str, str]
+    verbose : int
+    """
+    _setup_logging(verbose=verbose)
+    _worker_state["stub_transformer"] = Py2StubTransformer(
+        types_db=types_db, replace_doctypes=replace_doctypes
+    )
+
+
+def _generate_stub_in_worker(paths):
+    """Generate a stub in a worker process and return the collected statistics.
+
+    Parameters
+    ----------
+    paths : tuple[Path, Path]
+        The source path and target path of the stub.
+
+    Returns
+    -------
+    successful_queries : int
+    unknown_doctypes : list[str]
+    grammar_errors : int
+    """
+    source_path, stub_path = paths
+    stub_transformer = _worker_state["stub_transformer"]
+    types_db = stub_transformer.types_db
+    # Reset statistics, so that only the ones of this file are returned
+    types_db.stats["successful_queries"] = 0
+    types_db.stats["unknown_doctypes"] = []
+    stub_transformer.transformer.stats["grammar_errors"] = 0
+
+    _generate_stub(source_path, stub_path, stub_transformer=stub_transformer)
+
+    return (
+        types_db.stats["successful_queries"],
+        types_db.stats["unknown_doctypes"],
+        stub_transformer.transformer.stats["grammar_errors"],
+    )
+
+
 @contextmanager
 def report_execution_time():
     start = time.time()
@@ -135,10 +218,18 @@ def report_execution_time():
     type=click.Path(exists=True, dir_okay=False),
     help="Set configuration file explicitly.",
 )
+@click.option(
+    "-W",
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of processes used to create stubs in parallel.",
+)
 @click.option("-v", "--verbose", count=True, help="Log more details.")
 @click.help_option("-h", "--help")
 @report_execution_time()
-def main(source_dir, out_dir, config_path, verbose):
+def main(source_dir, out_dir, config_path, workers, verbose):
     _setup_logging(verbose=verbose)
 
     source_dir = Path(source_dir)
@@ -158,41 +249,43 @@ def main(source_dir, out_dir, config_path, verbose):
     out_dir = Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    for source_path, stub_path in walk_source_and_targets(source_dir, out_dir):
-        if source_path.suffix.lower() == ".pyi":
-            logger.debug("using existing stub file %s", source_path)
-            with source_path.open() as fo:
-                stub_content = fo.read()
-        else:
-            with source_path.open() as fo:
-                py_content = fo.read()
-            logger.debug("creating stub from %s", source_path)
-            try:
-                stub_content = stub_transformer.python_to_stub(
-                    py_content, module_path=source_path
-                )
-            except (SystemExit, KeyboardInterrupt):
-                raise
-            except Exception as e:
-                logger.exception("failed creating stub for %s:\n\n%s", source_path, e)
-                continue
-        stub_path.parent.mkdir(parents=True, exist_ok=True)
-        with stub_path.open("w") as fo:
-            logger.info("wrote %s", stub_path)
-            fo.write(stub_content)
+    paths = walk_source_and_targets(source_dir, out_dir)
+    if workers == 1:
+        for source_path, stub_path in paths:
+            _generate_stub(source_path, stub_path, stub_transformer=stub_transformer)
+        successful_queries = types_db.stats["successful_queries"]
+        unknown_doctypes = types_db.stats["unknown_doctypes"]
+        grammar_errors = stub_transformer.transformer.stats["grammar_errors"]
+    else:
+        paths = list(paths)
+        # Send a few files per message, but enough messages to keep all
+        # workers busy until the end
+        chunksize = max(1, len(paths) // (workers * 4))
+        successful_queries = 0
+        unknown_doctypes = []
+        grammar_errors = 0
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(types_db, config.replace_doctypes, verbose),
+        ) as executor:
+            for file_stats in executor.map(
+                _generate_stub_in_worker, paths, chunksize=chunksize
+            ):
+                successful_queries += file_stats[0]
+                unknown_doctypes += file_stats[1]
+                grammar_errors += file_stats[2]
 
     # Report basic statistics
-    successful_queries = types_db.stats["successful_queries"]
     click.secho(f"{successful_queries} matched annotations", fg="green")
 
-    grammar_errors = stub_transformer.transformer.stats["grammar_errors"]
     if grammar_errors:
         click.secho(f"{grammar_errors} grammar violations", fg="red")
 
-    unknown_doctypes = types_db.stats["unknown_doctypes"]
+    unknown_doctypes = set(unknown_doctypes)
     if unknown_doctypes:
         click.secho(f"{len(unknown_doctypes)} unknown doctypes:", fg="red")
-        click.echo("  " + "\n  ".join(set(unknown_doctypes)))
+        click.echo("  " + "\n  ".join(unknown_doctypes))
 
     if unknown_doctypes or grammar_errors:
         sys.exit(1)
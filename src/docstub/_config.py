@@ -59,7 +59,13 @@ class Config:
         if not isinstance(self.known_imports, dict):
             raise TypeError("known_imports must be a dict")
         if not isinstance(self.replace_doctypes, dict):
-            raise TypeError("replace_doctypes must be a string")
+            raise TypeError("replace_doctypes must be a dict")
+        for key, value in self.replace_doctypes.items():
+            if not (isinstance(key, str) and isinstance(value, str)):
+                raise TypeError(
+                    "replace_doctypes must map strings to strings, "
+                    f"got {key!r} = {value!r}"
+                )
 
     def __repr__(self):
         sources = " | ".join(str(s) for s in self._source)
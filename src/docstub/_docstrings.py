@@ -1,16 +1,18 @@
 """Transform types defined in docstrings to Python parsable types."""
 
+import keyword
 import logging
+import re
 import traceback
 from dataclasses import dataclass, field
-from functools import cached_property
+from functools import cache, cached_property, lru_cache
 from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
 
 import click
 import lark
 import lark.visitors
-from numpydoc.docscrape import NumpyDocString
 
 from ._analysis import KnownImport
 from ._utils import ContextFormatter, DocstubError, accumulate_qualname, escape_qualname
@@ -25,16 +27,112 @@ grammar_path = here / "doctype.lark"
 with grammar_path.open() as file:
     _grammar = file.read()
 
-_lark = lark.Lark(_grammar, propagate_positions=True)
+# A doctype consisting only of a qualname that may be marked as optional,
+# uses the same rules as the grammar for NAME and qualname
+_SIMPLE_DOCTYPE_REGEX = re.compile(
+    r"(?P<qualname>(?:~\.)?[^\W\d][\w-]*(?:\.[^\W\d][\w-]*)*)(?:\s*,\s*optional)?"
+)
+
+
+# Header of a docstring section that DocstringAnnotations makes use of,
+# only a pre-screen, the sections are still parsed by numpydoc. Matches at
+# least what numpydoc accepts: it strips both lines (including any "\r") and
+# only checks how the underline starts
+_ANNOTATED_SECTION_REGEX = re.compile(
+    r"^[^\S\n]*(?:Parameters|Other Parameters|Returns|Attributes)[^\S\n]*\n"
+    r"[^\S\n]*[-=]",
+    flags=re.MULTILINE | re.IGNORECASE,
+)
+
+
+# Marks the location of an error in a doctype
+_ERROR_CARET = click.style("^", fg="red", bold=True)
+
+
+@cache
+def _doctype_parser():
+    """Return the parser for doctypes, built once on first use.
+
+    Constructing the Earley parser takes a noticeable amount of time. Lark can
+    only cache its grammar analysis to disk for LALR parsers, which the
+    ambiguous doctype grammar doesn't support. So defer construction until a
+    doctype actually needs to be parsed.
+
+    Returns
+    -------
+    parser : lark.Lark
+    """
+    parser = lark.Lark(_grammar, propagate_positions=True)
+    return parser
+
+
+@lru_cache(maxsize=4096)
+def _parse_doctype(doctype):
+    """Parse a doctype, sharing the tree of repeated doctypes.
+
+    The same doctypes are used throughout a package, and transforming a tree
+    doesn't modify it, so trees can be reused.
+
+    Parameters
+    ----------
+    doctype : str
+
+    Returns
+    -------
+    tree : lark.Tree
+    """
+    tree = _doctype_parser().parse(doctype)
+    return tree
 
 
-def _find_one_token(tree: lark.Tree, *, name: str) -> lark.Token:
-    """Find token with a specific type name in tree."""
-    tokens = [child for child in tree.children if child.type == name]
-    if len(tokens) != 1:
-        msg = f"expected exactly one Token of type {name}, found {len(tokens)}"
-        raise ValueError(msg)
-    return tokens[0]
+@lru_cache(maxsize=1024)
+def _any_alias(name):
+    """Return the import that aliases ``typing.Any`` to an unknown name.
+
+    The same unknown names occur repeatedly, so share one instance per name.
+
+    Parameters
+    ----------
+    name : str
+        An escaped name that can be used as a Python variable.
+
+    Returns
+    -------
+    any_alias : ~.KnownImport
+    """
+    any_alias = KnownImport(import_name="Any", import_path="typing", import_alias=name)
+    return any_alias
+
+
+def _parse_np_docstring(docstring):
+    """Parse a docstring with numpydoc.
+
+    numpydoc is only imported once a docstring needs to be parsed, which
+    keeps importing this module cheap.
+
+    Parameters
+    ----------
+    docstring : str
+
+    Returns
+    -------
+    np_docstring : numpydoc.docscrape.NumpyDocString
+    """
+    from numpydoc.docscrape import NumpyDocString
+
+    np_docstring = NumpyDocString(docstring)
+    return np_docstring
+
+
+# Stands in for the parsed sections of docstrings without annotated sections,
+# read-only because it's shared
+_NO_ANNOTATED_SECTIONS = MappingProxyType(
+    {"Parameters": (), "Other Parameters": (), "Returns": (), "Attributes": ()}
+)
+
+
+# Shared by all annotations without imports
+_NO_IMPORTS = frozenset()
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -45,7 +143,10 @@ class Annotation:
     imports: frozenset[KnownImport] = field(default_factory=frozenset)
 
     def __post_init__(self):
-        object.__setattr__(self, "imports", frozenset(self.imports))
+        if not self.imports:
+            object.__setattr__(self, "imports", _NO_IMPORTS)
+        elif not isinstance(self.imports, frozenset):
+            object.__setattr__(self, "imports", frozenset(self.imports))
         if "~" in self.value:
             raise ValueError(f"unexpected '~' in annotation value: {self.value}")
         for import_ in self.imports:
@@ -55,6 +156,11 @@ class Annotation:
     def __str__(self) -> str:
         return self.value
 
+    def __hash__(self) -> int:
+        # Annotations with the same value nearly always share their imports,
+        # so skip hashing these
+        return hash(self.value)
+
     @classmethod
     def as_return_tuple(cls, return_types):
         """Concatenate multiple annotations and wrap in tuple if more than one.
@@ -72,6 +178,10 @@ class Annotation:
         concatenated : Annotation
             The concatenated types.
         """
+        return_types = tuple(return_types)
+        if len(return_types) == 1:
+            # Nothing to concatenate, a single return type is used as is
+            return return_types[0]
         values, imports = cls._aggregate_annotations(*return_types)
         value = ", ".join(values)
         if len(values) > 1:
@@ -125,13 +235,10 @@ class Annotation:
         Returns
         -------
         values : list[str]
-        imports : set[~.KnownImport]
+        imports : frozenset[~.KnownImport]
         """
-        values = []
-        imports = set()
-        for p in types:
-            values.append(p.value)
-            imports.update(p.imports)
+        values = [p.value for p in types]
+        imports = frozenset().union(*(p.imports for p in types))
         return values, imports
 
 
@@ -144,6 +251,8 @@ class QualnameIsKeyword(DocstubError):
     """Raised when a qualname is a blacklisted Python keyword."""
 
 
+# Rules are passed their Tree by default. Rules that only need their children
+# override this with `inline=True`, which avoids creating a Tree for each call
 @lark.visitors.v_args(tree=True)
 class DoctypeTransformer(lark.visitors.Transformer):
     """Transformer for docstring type descriptions (doctypes).
@@ -168,42 +277,9 @@ class DoctypeTransformer(lark.visitors.Transformer):
     [('tuple', 0, 5), ('int', 9, 12)]
     """
 
-    blacklisted_qualnames = frozenset(
-        {
-            "await",
-            "else",
-            "import",
-            "pass",
-            "break",
-            "except",
-            "in",
-            "raise",
-            "class",
-            "finally",
-            "is",
-            "return",
-            "and",
-            "continue",
-            "for",
-            "lambda",
-            "try",
-            "as",
-            "def",
-            "from",
-            "nonlocal",
-            "while",
-            "assert",
-            "del",
-            "global",
-            "not",
-            "with",
-            "async",
-            "elif",
-            "if",
-            "or",
-            "yield",
-        }
-    )
+    # Keywords can't be used as names, except the ones that are valid in
+    # annotations themselves
+    blacklisted_qualnames = frozenset(keyword.kwlist) - {"True", "False", "None"}
 
     def __init__(self, *, types_db=None, replace_doctypes=None, **kwargs):
         """
@@ -219,16 +295,59 @@ class DoctypeTransformer(lark.visitors.Transformer):
         if replace_doctypes is None:
             replace_doctypes = {}
 
+        # Reused for every transformed doctype
+        self._collected_imports = []
+        self._queried_names = []
+        self._unknown_qualnames = None
+        # Results of `doctype_to_annotation` for the current module, cached for
+        # the same reasons as the results of `TypesDatabase.query`
+        self._annotation_cache = {}
+        self._annotation_cache_source = None
+
         self.types_db = types_db
         self.replace_doctypes = replace_doctypes
 
-        self._collected_imports = None
-        self._unknown_qualnames = None
-
         super().__init__(**kwargs)
 
         self.stats = {"grammar_errors": 0}
 
+    @property
+    def types_db(self):
+        """A static database of collected types usable as an annotation.
+
+        Returns
+        -------
+        types_db : ~.TypesDatabase or None
+        """
+        return self._types_db
+
+    @types_db.setter
+    def types_db(self, value):
+        self._types_db = value
+        # Cached results may have been matched with the previous database
+        self._annotation_cache.clear()
+
+    @property
+    def replace_doctypes(self):
+        """Replacements for human-friendly aliases.
+
+        Assign a new dictionary to change the replacements, changes made to
+        the assigned dictionary in-place are not picked up.
+
+        Returns
+        -------
+        replace_doctypes : dict[str, str]
+        """
+        return self._replace_doctypes
+
+    @replace_doctypes.setter
+    def replace_doctypes(self, value):
+        self._replace_doctypes = value
+        # Replacements only apply if their first name matches, check that first
+        self._replace_first_names = frozenset(key.partition(".")[0] for key in value)
+        # Cached results may have used the previous replacements
+        self._annotation_cache.clear()
+
     def doctype_to_annotation(self, doctype):
         """Turn a type description in a docstring into a type annotation.
 
@@ -245,13 +364,39 @@ class DoctypeTransformer(lark.visitors.Transformer):
             A set containing tuples. Each tuple contains a qualname, its start and its
             end index relative to the given `doctype`.
         """
+        current_source = None
+        if self.types_db is not None:
+            current_source = self.types_db.current_source
+        if current_source != self._annotation_cache_source:
+            self._annotation_cache.clear()
+            self._annotation_cache_source = current_source
+
+        cached = self._annotation_cache.get(doctype)
+        if cached is not None:
+            annotation, unknown_qualnames, queried_names = cached
+            # Repeat the skipped queries, so that the statistics of `types_db`
+            # don't depend on the cache
+            for name in queried_names:
+                self.types_db.query(name)
+            return annotation, list(unknown_qualnames)
+
         try:
-            self._collected_imports = set()
+            self._collected_imports.clear()
+            self._queried_names.clear()
+            # Not reused, it's returned to the caller
             self._unknown_qualnames = []
-            tree = _lark.parse(doctype)
-            value = super().transform(tree=tree)
-            annotation = Annotation(
-                value=value, imports=frozenset(self._collected_imports)
+            value = self._transform_simple_doctype(doctype)
+            if value is None:
+                tree = _parse_doctype(doctype)
+                value = super().transform(tree=tree)
+            imports = _NO_IMPORTS
+            if self._collected_imports:
+                imports = frozenset(self._collected_imports)
+            annotation = Annotation(value=value, imports=imports)
+            self._annotation_cache[doctype] = (
+                annotation,
+                tuple(self._unknown_qualnames),
+                tuple(self._queried_names),
             )
             return annotation, self._unknown_qualnames
         except (
@@ -261,9 +406,6 @@ class DoctypeTransformer(lark.visitors.Transformer):
         ):
             self.stats["grammar_errors"] += 1
             raise
-        finally:
-            self._collected_imports = None
-            self._unknown_qualnames = None
 
     def __default__(self, data, children, meta):
         """Unpack children of rule nodes by default.
@@ -279,118 +421,200 @@ class DoctypeTransformer(lark.visitors.Transformer):
 
         Returns
         -------
-        out : lark.Token or list[lark.Token, ...]
-            Either a token or list of tokens.
+        out : lark.Token or str or list[lark.Token | str, ...]
+            Either a single child or list of children.
         """
-        if isinstance(children, list) and len(children) == 1:
+        if len(children) == 1:
             out = children[0]
-            out.type = data.upper()  # Turn rule into "token"
         else:
             out = children
         return out
 
-    def annotation(self, tree):
-        out = " | ".join(tree.children)
+    @lark.visitors.v_args(inline=True)
+    def annotation(self, *children):
+        out = " | ".join(children)
         return out
 
-    def types_or(self, tree):
-        out = " | ".join(tree.children)
-        return out
+    # Alternatives are joined the same way, whether on the top level or nested
+    types_or = annotation
 
-    def optional(self, tree):
+    @lark.visitors.v_args(inline=True)
+    def optional(self, *children):
         logger.debug("dropping optional / default info")
         return lark.Discard
 
-    def extra_info(self, tree):
+    @lark.visitors.v_args(inline=True)
+    def extra_info(self, *children):
         logger.debug("dropping extra info")
         return lark.Discard
 
-    def sphinx_ref(self, tree):
-        qualname = _find_one_token(tree, name="QUALNAME")
+    @lark.visitors.v_args(inline=True)
+    def sphinx_ref(self, *children):
+        # The referenced qualname follows the optional role
+        qualname = children[-1]
         return qualname
 
-    def container(self, tree):
-        _container, *_content = tree.children
+    @lark.visitors.v_args(inline=True)
+    def container(self, _container, *_content):
         _content = ", ".join(_content)
         assert _content
         out = f"{_container}[{_content}]"
         return out
 
     def qualname(self, tree):
-        children = tree.children
-        _qualname = ".".join(children)
-
-        for partial_qualname in accumulate_qualname(_qualname):
-            replacement = self.replace_doctypes.get(partial_qualname)
-            if replacement:
-                _qualname = _qualname.replace(partial_qualname, replacement)
-                break
-
-        _qualname = self._find_import(_qualname, meta=tree.meta)
-
-        if _qualname in self.blacklisted_qualnames:
-            msg = (
-                f"qualname {_qualname!r} in docstring type description "
-                "is a reserved Python keyword and not allowed"
-            )
-            raise QualnameIsKeyword(msg)
-
-        _qualname = lark.Token(type="QUALNAME", value=_qualname)
+        _qualname = ".".join(tree.children)
+        _qualname = self._match_qualname(
+            _qualname, start_pos=tree.meta.start_pos, end_pos=tree.meta.end_pos
+        )
         return _qualname
 
     def array_name(self, tree):
         qualname = self.qualname(tree)
-        qualname = lark.Token("ARRAY_NAME", str(qualname))
+        qualname = lark.Token("ARRAY_NAME", qualname)
         return qualname
 
-    def shape(self, tree):
+    @lark.visitors.v_args(inline=True)
+    def shape(self, *children):
         logger.debug("dropping shape information")
         return lark.Discard
 
-    def shape_n_dtype(self, tree):
-        name = _find_one_token(tree, name="ARRAY_NAME")
-        children = [child for child in tree.children if child != name]
-        if children:
-            name = f"{name}[{', '.join(children)}]"
+    @lark.visitors.v_args(inline=True)
+    def shape_n_dtype(self, *children):
+        # Split off the array name from remaining children in a single pass
+        name = None
+        others = []
+        for child in children:
+            if not isinstance(child, lark.Token) or child.type != "ARRAY_NAME":
+                others.append(child)
+            elif name is None:
+                name = child
+            else:
+                msg = "expected exactly one Token of type ARRAY_NAME, found more"
+                raise ValueError(msg)
+        if name is None:
+            msg = "expected exactly one Token of type ARRAY_NAME, found 0"
+            raise ValueError(msg)
+
+        if others:
+            name = f"{name}[{', '.join(others)}]"
         return name
 
-    def contains(self, tree):
-        out = ", ".join(tree.children)
+    @lark.visitors.v_args(inline=True)
+    def contains(self, *children):
+        out = ", ".join(children)
         out = f"[{out}]"
         return out
 
-    def literals(self, tree):
-        out = ", ".join(tree.children)
+    @lark.visitors.v_args(inline=True)
+    def literals(self, *children):
+        out = ", ".join(children)
         out = f"Literal[{out}]"
         if self.types_db is not None:
-            _, known_import = self.types_db.query("Literal")
+            _, known_import = self._query("Literal")
             if known_import:
-                self._collected_imports.add(known_import)
+                self._collected_imports.append(known_import)
         return out
 
-    def _find_import(self, qualname, meta):
+    def _transform_simple_doctype(self, doctype):
+        """Transform a doctype that is only a (optional) qualname without parsing it.
+
+        Many doctypes are a single name like "int" or "np.ndarray, optional".
+        These are matched directly, skipping the comparatively slow parser.
+
+        Parameters
+        ----------
+        doctype : str
+
+        Returns
+        -------
+        value : str or None
+            The transformed doctype or None if the doctype isn't simple and
+            requires the parser.
+        """
+        match = _SIMPLE_DOCTYPE_REGEX.fullmatch(doctype)
+        if match is None:
+            return None
+        qualname = match.group("qualname")
+        if qualname in self.blacklisted_qualnames:
+            return None  # Let the parser handle and report this case
+        try:
+            value = self._match_qualname(
+                qualname,
+                start_pos=match.start("qualname"),
+                end_pos=match.end("qualname"),
+            )
+        except QualnameIsKeyword as error:
+            # Report this like lark does when the qualname rule raises, so that
+            # the error is handled the same as with the parser
+            raise lark.visitors.VisitError("qualname", doctype, error) from error
+        return value
+
+    def _match_qualname(self, qualname, *, start_pos, end_pos):
+        """Replace and match a qualname to a known import.
+
+        Parameters
+        ----------
+        qualname : str
+        start_pos, end_pos : int
+            Position of `qualname` in the doctype.
+
+        Returns
+        -------
+        qualname : str
+            The qualname to use in the annotation.
+        """
+        if qualname.partition(".")[0] in self._replace_first_names:
+            for partial_qualname in accumulate_qualname(qualname):
+                replacement = self.replace_doctypes.get(partial_qualname)
+                if replacement:
+                    # Only swap the matched prefix, it may occur again later on
+                    qualname = replacement + qualname[len(partial_qualname) :]
+                    break
+
+        qualname = self._find_import(qualname, start_pos=start_pos, end_pos=end_pos)
+
+        if qualname in self.blacklisted_qualnames:
+            msg = (
+                f"qualname {qualname!r} in docstring type description "
+                "is a reserved Python keyword and not allowed"
+            )
+            raise QualnameIsKeyword(msg)
+        return qualname
+
+    def _query(self, search_name):
+        """Query `types_db` and remember the name for repeated doctypes.
+
+        Parameters
+        ----------
+        search_name : str
+
+        Returns
+        -------
+        annotation_name : str | None
+        known_import : ~.KnownImport | None
+        """
+        self._queried_names.append(search_name)
+        return self.types_db.query(search_name)
+
+    def _find_import(self, qualname, *, start_pos, end_pos):
         """Match type names to known imports."""
         if self.types_db is not None:
-            annotation_name, known_import = self.types_db.query(qualname)
+            annotation_name, known_import = self._query(qualname)
         else:
             annotation_name = None
             known_import = None
 
         if known_import and known_import.has_import:
-            self._collected_imports.add(known_import)
+            self._collected_imports.append(known_import)
 
         if annotation_name:
             qualname = annotation_name
         else:
             # Unknown qualname, alias to `Any` and make visible
-            self._unknown_qualnames.append((qualname, meta.start_pos, meta.end_pos))
+            self._unknown_qualnames.append((qualname, start_pos, end_pos))
             qualname = escape_qualname(qualname)
-            any_alias = KnownImport(
-                import_name="Any",
-                import_path="typing",
-                import_alias=qualname,
-            )
-            self._collected_imports.add(any_alias)
+            any_alias = _any_alias(qualname)
+            self._collected_imports.append(any_alias)
         return qualname
 
 
@@ -421,12 +645,16 @@ class DocstringAnnotations:
         ctx : ~.ContextFormatter, optional
         """
         self.docstring = docstring
-        self.np_docstring = NumpyDocString(docstring)
+        if _ANNOTATED_SECTION_REGEX.search(docstring):
+            self.np_docstring = _parse_np_docstring(docstring)
+        else:
+            # Nothing to annotate, skip parsing the docstring
+            self.np_docstring = _NO_ANNOTATED_SECTIONS
         self.transformer = transformer
 
         self._ctx: ContextFormatter = ctx
 
-    def _doctype_to_annotation(self, doctype, ds_line=0):
+    def _doctype_to_annotation(self, doctype, *, name=None):
         """Convert a type description to a Python-ready type.
 
         Parameters
@@ -434,8 +662,9 @@ class DocstringAnnotations:
         doctype : str
             The type description of a parameter or return value, as extracted from
             a docstring.
-        ds_line : int, optional
-            The line number relative to the docstring.
+        name : str, optional
+            The name of the documented parameter or return value. Used to find
+            the line of `doctype` in the docstring for reported messages.
 
         Returns
         -------
@@ -443,65 +672,123 @@ class DocstringAnnotations:
             The transformed type, ready to be inserted into a stub file, with
             necessary imports attached.
         """
-        if self._ctx is not None:
-            ctx = self._ctx.with_line(offset=ds_line)
-        else:
-            ctx = None
-
         try:
             annotation, unknown_qualnames = self.transformer.doctype_to_annotation(
                 doctype
             )
 
         except (lark.exceptions.LexError, lark.exceptions.ParseError) as error:
-            details = None
-            if hasattr(error, "get_context"):
-                details = error.get_context(doctype)
-                details = details.replace("^", click.style("^", fg="red", bold=True))
-            if ctx:
+            ctx = self._doctype_ctx(doctype, name=name)
+            if ctx is not None:
+                details = None
+                if hasattr(error, "get_context"):
+                    details = error.get_context(doctype)
+                    details = details.replace("^", _ERROR_CARET)
                 ctx.print_message("invalid syntax in doctype", details=details)
             return FallbackAnnotation
 
         except lark.visitors.VisitError as e:
-            tb = "\n".join(traceback.format_exception(e.orig_exc))
-            details = f"doctype: {doctype!r}\n\n{tb}"
-            if ctx:
+            ctx = self._doctype_ctx(doctype, name=name)
+            if ctx is not None:
+                tb = "\n".join(traceback.format_exception(e.orig_exc))
+                details = f"doctype: {doctype!r}\n\n{tb}"
                 ctx.print_message(
                     "unexpected error while parsing doctype", details=details
                 )
             return FallbackAnnotation
 
         else:
-            for name, start_col, stop_col in unknown_qualnames:
-                width = stop_col - start_col
-                error_underline = click.style("^" * width, fg="red", bold=True)
-                details = f"{doctype}\n{' ' * start_col}{error_underline}\n"
-                if ctx:
+            if unknown_qualnames:
+                ctx = self._doctype_ctx(doctype, name=name)
+            else:
+                ctx = None
+            if ctx is not None:
+                for qualname, start_col, stop_col in unknown_qualnames:
+                    width = stop_col - start_col
+                    error_underline = click.style("^" * width, fg="red", bold=True)
+                    details = f"{doctype}\n{' ' * start_col}{error_underline}\n"
                     ctx.print_message(
-                        f"unknown name in doctype: {name!r}", details=details
+                        f"unknown name in doctype: {qualname!r}", details=details
                     )
             return annotation
 
+    def _doctype_ctx(self, doctype, *, name=None):
+        """Return the context to report messages about a doctype with.
+
+        Only called when a message is reported, searching the line of the
+        doctype in the docstring isn't needed otherwise.
+
+        Parameters
+        ----------
+        doctype : str
+        name : str, optional
+            The name documented with `doctype`.
+
+        Returns
+        -------
+        ctx : ~.ContextFormatter or None
+            None, if this instance has no context to report messages with.
+        """
+        if self._ctx is None:
+            return None
+        ds_line = 0
+        if name is not None:
+            ds_line = self._find_docstring_line(name, doctype)
+        ctx = self._ctx.with_line(offset=ds_line)
+        return ctx
+
     @cached_property
-    def attributes(self) -> dict[str, Annotation]:
+    def _docstring_lines(self):
+        return self.docstring.split("\n")
+
+    def _find_docstring_line(self, name, doctype):
+        """Find the first line in the docstring that contains a name and doctype.
+
+        Parameters
+        ----------
+        name : str
+        doctype : str
+
+        Returns
+        -------
+        ds_line : int
+            The line number relative to the docstring, 0 if no line matches.
+        """
+        for i, line in enumerate(self._docstring_lines):
+            if name in line and doctype in line:
+                return i
+        return 0
+
+    def _params_to_annotations(self, params):
+        """Transform the doctypes of documented parameters into annotations.
+
+        Parameters
+        ----------
+        params : Iterable[numpydoc.docscrape.Parameter]
+            Parameters, attributes or return values as parsed by numpydoc.
+            Entries without a doctype are skipped.
+
+        Returns
+        -------
+        annotations : dict[str, Annotation]
+        """
         annotations = {}
-        for attribute in self.np_docstring["Attributes"]:
-            if not attribute.type:
+        for param in params:
+            if not param.type:
                 continue
 
-            ds_line = 0
-            for i, line in enumerate(self.docstring.split("\n")):
-                if attribute.name in line and attribute.type in line:
-                    ds_line = i
-                    break
-
-            if attribute.name in annotations:
-                logger.warning("duplicate parameter name %r, ignoring", attribute.name)
+            if param.name in annotations:
+                logger.warning("duplicate parameter name %r, ignoring", param.name)
                 continue
 
-            annotation = self._doctype_to_annotation(attribute.type, ds_line=ds_line)
-            annotations[attribute.name] = annotation
+            annotation = self._doctype_to_annotation(param.type, name=param.name)
+            annotations[param.name] = annotation
+
+        return annotations
 
+    @cached_property
+    def attributes(self) -> dict[str, Annotation]:
+        annotations = self._params_to_annotations(self.np_docstring["Attributes"])
         return annotations
 
     @cached_property
@@ -509,46 +796,16 @@ class DocstringAnnotations:
         all_params = chain(
             self.np_docstring["Parameters"], self.np_docstring["Other Parameters"]
         )
-        annotated_params = {}
-        for param in all_params:
-            if not param.type:
-                continue
-
-            ds_line = 0
-            for i, line in enumerate(self.docstring.split("\n")):
-                if param.name in line and param.type in line:
-                    ds_line = i
-                    break
-
-            if param.name in annotated_params:
-                logger.warning("duplicate parameter name %r, ignoring", param.name)
-                continue
-
-            annotation = self._doctype_to_annotation(param.type, ds_line=ds_line)
-            annotated_params[param.name] = annotation
-
+        annotated_params = self._params_to_annotations(all_params)
         return annotated_params
 
     @cached_property
     def returns(self) -> Annotation | None:
-        annotated_params = {}
-        for param in self.np_docstring["Returns"]:
-            # NumPyDoc always requires a doctype for returns,
-            assert param.type
-
-            ds_line = 0
-            for i, line in enumerate(self.docstring.split("\n")):
-                if param.name in line and param.type in line:
-                    ds_line = i
-                    break
-
-            if param.name in annotated_params:
-                logger.warning("duplicate parameter name %r, ignoring", param.name)
-                continue
-
-            annotation = self._doctype_to_annotation(param.type, ds_line=ds_line)
-            annotated_params[param.name] = annotation
+        params = self.np_docstring["Returns"]
+        # NumPyDoc always requires a doctype for returns,
+        assert all(param.type for param in params)
 
+        annotated_params = self._params_to_annotations(params)
         if annotated_params:
             out = Annotation.as_return_tuple(annotated_params.values())
         else:
@@ -41,6 +41,7 @@ def accumulate_qualname(qualname, *, start_right=False):
     return out
 
 
+@lru_cache(maxsize=1024)
 def escape_qualname(name):
     """Format a string such that it can be used as a valid Python variable.
 
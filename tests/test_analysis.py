@@ -148,3 +148,11 @@ class Test_TypesDatabase:
             assert annotation.startswith(known_import.target)
             assert annotation == exp_annotation
     # fmt: on
+
+    def test_repeated_query(self):
+        db = TypesDatabase(known_imports=self.known_imports.copy())
+        for _ in range(2):
+            assert db.query("~.Baz") == ("Baz", self.known_imports["foo.bar.Baz"])
+            assert db.query("~.Gul") == (None, None)
+        assert db.stats["successful_queries"] == 2
+        assert db.stats["unknown_doctypes"] == ["Gul", "Gul"]
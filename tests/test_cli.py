@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from docstub._cli import main
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+
+def test_workers(tmp_path, monkeypatch):
+    # Keep the cache of collected types out of the repository
+    monkeypatch.chdir(tmp_path)
+    runner = CliRunner()
+
+    outputs = []
+    stubs = []
+    for workers in [1, 2]:
+        out_dir = tmp_path / f"stubs-{workers}"
+        args = [
+            str(EXAMPLES_DIR / "example_pkg"),
+            "--out-dir",
+            str(out_dir),
+            "--config",
+            str(EXAMPLES_DIR / "docstub.toml"),
+            "--workers",
+            str(workers),
+        ]
+        result = runner.invoke(main, args)
+        assert result.exit_code == 0, result.output
+        # Drop the reported execution time
+        output = [
+            line for line in result.output.splitlines() if "Finished in" not in line
+        ]
+        outputs.append(output)
+        stubs.append(
+            {
+                path.relative_to(out_dir): path.read_text()
+                for path in out_dir.rglob("*.pyi")
+            }
+        )
+
+    assert outputs[0] == outputs[1]
+    assert "matched annotations" in outputs[0][0]
+    assert stubs[0] == stubs[1]
+    assert len(stubs[0]) > 0
@@ -0,0 +1,21 @@
+import pytest
+
+from docstub._config import Config
+
+
+class Test_Config:
+    def test_replace_doctypes(self):
+        config = Config(replace_doctypes={"array-like": "ArrayLike"})
+        assert config.replace_doctypes == {"array-like": "ArrayLike"}
+
+    @pytest.mark.parametrize(
+        "replace_doctypes",
+        [{"array-like": 1}, {1: "ArrayLike"}, {"array-like": None}],
+    )
+    def test_replace_doctypes_invalid(self, replace_doctypes):
+        with pytest.raises(TypeError, match="must map strings to strings, got"):
+            Config(replace_doctypes=replace_doctypes)
+
+    def test_replace_doctypes_not_a_dict(self):
+        with pytest.raises(TypeError, match="replace_doctypes must be a dict"):
+            Config(replace_doctypes=[("array-like", "ArrayLike")])
@@ -1,9 +1,16 @@
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
 
-from docstub._analysis import KnownImport
-from docstub._docstrings import Annotation, DocstringAnnotations, DoctypeTransformer
+from docstub._analysis import KnownImport, TypesDatabase, common_known_imports
+from docstub._docstrings import (
+    Annotation,
+    DocstringAnnotations,
+    DoctypeTransformer,
+    FallbackAnnotation,
+)
+from docstub._utils import ContextFormatter
 
 
 class Test_Annotation:
@@ -29,10 +36,34 @@ class Test_Annotation:
         assert return_annotation.value == "tuple[Path, Sequence]"
         assert return_annotation.imports == path_anno.imports | sequence_anno.imports
 
+    def test_imports(self):
+        path_import = KnownImport(import_name="Path", import_path="pathlib")
+        annotation = Annotation(value="Path", imports=[path_import])
+        assert annotation.imports == frozenset({path_import})
+        assert isinstance(annotation.imports, frozenset)
+        assert Annotation(value="int").imports is Annotation(value="str").imports
+
+    def test_as_return_tuple_single(self):
+        path_anno = Annotation(
+            value="Path",
+            imports=frozenset({KnownImport(import_name="Path", import_path="pathlib")}),
+        )
+        assert Annotation.as_return_tuple([path_anno]) is path_anno
+
     def test_unexpected_value(self):
         with pytest.raises(ValueError, match="unexpected '~' in annotation value"):
             Annotation(value="~.foo")
 
+    def test_hash(self):
+        path_anno = Annotation(
+            value="Path",
+            imports=frozenset({KnownImport(import_name="Path", import_path="pathlib")}),
+        )
+        other_anno = Annotation(value="Path")
+        assert hash(path_anno) == hash(other_anno)
+        assert path_anno != other_anno
+        assert len({path_anno, other_anno}) == 2
+
 
 class Test_DoctypeTransformer:
     # fmt: off
@@ -166,6 +197,92 @@ class Test_DoctypeTransformer:
         }
         assert unknown_names == [("a.b", 0, 3), ("c", 7, 8)]
 
+    @pytest.mark.parametrize(
+        ("doctype", "expected"),
+        [
+            ("numpy", "np"),
+            # Unknown names are escaped
+            ("numpy.numpy_like", "np_numpy_like"),
+            ("list of numpy.ndarray", "list[np_ndarray]"),
+        ],
+    )
+    def test_replace_doctypes(self, doctype, expected):
+        transformer = DoctypeTransformer(replace_doctypes={"numpy": "np"})
+        annotation, _ = transformer.doctype_to_annotation(doctype)
+        assert annotation.value == expected
+
+    def test_replace_doctypes_reassigned(self):
+        transformer = DoctypeTransformer(replace_doctypes={"numpy": "np"})
+        annotation, _ = transformer.doctype_to_annotation("numpy.ndarray")
+        assert annotation.value == "np_ndarray"
+        transformer.replace_doctypes = {"numpy.ndarray": "ndarray"}
+        annotation, _ = transformer.doctype_to_annotation("numpy.ndarray")
+        assert annotation.value == "ndarray"
+
+    @pytest.mark.parametrize(
+        ("doctype", "expected", "expected_unknown"),
+        [
+            ("a", "a", [("a", 0, 1)]),
+            ("a.b, optional", "a_b", [("a.b", 0, 3)]),
+            ("array-like , optional", "array_like", [("array-like", 0, 10)]),
+        ],
+    )
+    def test_simple_doctype(self, doctype, expected, expected_unknown, monkeypatch):
+        # Doctypes consisting of a single qualname don't need the parser
+        def fail(doctype):
+            raise AssertionError("parser shouldn't be used")
+
+        # Parse trees are cached, replace the cached function itself
+        monkeypatch.setattr("docstub._docstrings._parse_doctype", fail)
+        transformer = DoctypeTransformer()
+        annotation, unknown_names = transformer.doctype_to_annotation(doctype)
+        assert annotation.value == expected
+        assert unknown_names == expected_unknown
+
+    def test_repeated_doctype(self):
+        transformer = DoctypeTransformer()
+        annotation, unknown_names = transformer.doctype_to_annotation("list of a")
+        cached_annotation, cached_unknown_names = transformer.doctype_to_annotation(
+            "list of a"
+        )
+        assert cached_annotation is annotation
+        assert cached_unknown_names == unknown_names == [("list", 0, 4), ("a", 8, 9)]
+        # Returned lists can be modified without affecting later results
+        assert cached_unknown_names is not unknown_names
+
+    def test_repeated_doctype_stats(self):
+        types_db = TypesDatabase(known_imports=common_known_imports())
+        transformer = DoctypeTransformer(types_db=types_db)
+        transformer.doctype_to_annotation("list of a")
+        transformer.doctype_to_annotation("list of a")
+        assert types_db.stats["successful_queries"] == 2
+        assert types_db.stats["unknown_doctypes"] == ["a", "a"]
+
+    def test_repeated_doctype_other_types_db(self):
+        transformer = DoctypeTransformer()
+        annotation, unknown_names = transformer.doctype_to_annotation("Sequence")
+        assert unknown_names == [("Sequence", 0, 8)]
+        transformer.types_db = TypesDatabase(known_imports=common_known_imports())
+        annotation, unknown_names = transformer.doctype_to_annotation("Sequence")
+        assert unknown_names == []
+        assert annotation.imports == {
+            KnownImport(import_path="collections.abc", import_name="Sequence")
+        }
+
+    def test_repeated_doctype_other_module(self, tmp_path):
+        types_db = TypesDatabase(known_imports=common_known_imports())
+        transformer = DoctypeTransformer(types_db=types_db)
+        (tmp_path / "a.py").touch()
+        (tmp_path / "b.py").touch()
+        types_db.current_source = tmp_path / "a.py"
+        annotation, _ = transformer.doctype_to_annotation("list of a")
+        types_db.current_source = tmp_path / "b.py"
+        other_annotation, _ = transformer.doctype_to_annotation("list of a")
+        assert other_annotation == annotation
+        assert other_annotation is not annotation
+        # Only results for the current module are kept
+        assert len(transformer._annotation_cache) == 1
+
 
 class Test_DocstringAnnotations:
     def test_empty_docstring(self):
@@ -175,6 +292,34 @@ class Test_DocstringAnnotations:
         assert annotations.parameters == {}
         assert annotations.returns is None
 
+    def test_no_annotated_sections(self, monkeypatch):
+        def fail(docstring):
+            raise AssertionError("numpydoc shouldn't be used")
+
+        monkeypatch.setattr("docstub._docstrings._parse_np_docstring", fail)
+        docstring = "Summary.\n\nNotes\n-----\nSome notes.\n"
+        transformer = DoctypeTransformer()
+        annotations = DocstringAnnotations(docstring, transformer=transformer)
+        assert annotations.attributes == {}
+        assert annotations.parameters == {}
+        assert annotations.returns is None
+
+    @pytest.mark.parametrize(
+        "header",
+        [
+            "Parameters\n----------",
+            "  parameters  \n  ==========  ",
+            "Other Parameters\n----------------",
+            # Windows line endings
+            "Parameters\r\n----------\r",
+        ],
+    )
+    def test_section_header(self, header):
+        docstring = f"Summary.\n\n{header}\na : int\n"
+        transformer = DoctypeTransformer()
+        annotations = DocstringAnnotations(docstring, transformer=transformer)
+        assert annotations.parameters["a"].value == "int"
+
     @pytest.mark.parametrize(
         ("doctype", "expected"),
         [
@@ -197,6 +342,50 @@ class Test_DocstringAnnotations:
         assert len(annotations.parameters) == 1
         assert annotations.parameters["a"].value == expected
 
+    def test_reported_line(self, monkeypatch, capsys):
+        docstring = dedent(
+            """
+            Parameters
+            ----------
+            a : int
+            b : list of unknown
+            """
+        )
+        ctx = ContextFormatter(path=Path("module.py"), line=10)
+        types_db = TypesDatabase(known_imports=common_known_imports())
+        transformer = DoctypeTransformer(types_db=types_db)
+        annotations = DocstringAnnotations(docstring, transformer=transformer, ctx=ctx)
+
+        searched = []
+        find_docstring_line = annotations._find_docstring_line
+
+        def spy(name, doctype):
+            searched.append(name)
+            return find_docstring_line(name, doctype)
+
+        monkeypatch.setattr(annotations, "_find_docstring_line", spy)
+        assert annotations.parameters.keys() == {"a", "b"}
+        # Only the line of a reported doctype is searched
+        assert searched == ["b"]
+        assert (
+            "module.py:14: unknown name in doctype: 'unknown'"
+            in capsys.readouterr().out
+        )
+
+    @pytest.mark.parametrize("doctype", ["foo", "foo, optional", "list of foo"])
+    def test_parameters_replaced_with_keyword(self, doctype):
+        docstring = dedent(
+            f"""
+        Parameters
+        ----------
+        a : {doctype}
+        """
+        )
+        transformer = DoctypeTransformer(replace_doctypes={"foo": "class"})
+        annotations = DocstringAnnotations(docstring, transformer=transformer)
+        assert annotations.parameters["a"] is FallbackAnnotation
+        assert transformer.stats["grammar_errors"] == 0
+
     @pytest.mark.parametrize(
         ("doctypes", "expected"),
         [